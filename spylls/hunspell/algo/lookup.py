@@ -219,7 +219,7 @@ class Lookup:
         # Remove characters that should be ignored (for example, in Arabic and Hebrew, vowels should
         # be removed before spellchecking)
         if self.aff.IGNORE:
-            word = word.translate(self.aff.IGNORE.tr)
+            word = self.aff.IGNORE.apply(word)
 
         # Numbers are allowed and considered "good word" always
         # TODO: check in hunspell's code, if there are some exceptions?..
@@ -251,9 +251,9 @@ class Lookup:
 
         yield [text]
         for pat in self.aff.BREAK:
-            for m in pat.regexp.finditer(text):
-                start = text[:m.start(1)]
-                rest = text[m.end(1):]
+            for start_pos, end_pos in pat.spans(text):
+                start = text[:start_pos]
+                rest = text[end_pos:]
                 for breaking in self.break_word(rest, depth=depth+1):
                     yield [start, *breaking]
 
@@ -580,7 +580,7 @@ class Lookup:
             # then to restore the original stem from word "prettier" we must remove "ier" and add back "y"
             stem = suffix.replace_regexp.sub(suffix.strip, word)
             # Even with matching flags, the suffix's condition still might prohibit this form
-            if not suffix.cond_regexp.search(stem):
+            if not suffix.condition_matches(stem):
                 continue
 
             yield AffixForm(word, stem, suffix=suffix)
@@ -617,7 +617,7 @@ class Lookup:
         for prefix in possible_prefixes:
             stem = prefix.replace_regexp.sub(prefix.strip, word)
 
-            if not prefix.cond_regexp.search(stem):
+            if not prefix.condition_matches(stem):
                 continue
 
             yield AffixForm(word, stem, prefix=prefix)
@@ -920,8 +920,11 @@ class Lookup:
 
             if aff.CHECKCOMPOUNDTRIPLE:
                 # CHECKCOMPOUNDTRIPLE setting tells, that if there is triplificatioin of some letter
-                # on the bound of two parts (like "foobb" + "bar"), it is not correct compound word
-                if len(set(left[-2:] + right[:1])) == 1 or len(set(left[-1:] + right[:2])) == 1:
+                # on the bound of two parts (like "foobb" + "bar"), it is not correct compound word.
+                # (Checked by plain char comparisons: the letters on the bound should be the same, and
+                # also the same as the one before or after them, if any.)
+                bound = right[:1]
+                if left[-1:] == bound and (left[-2:-1] in ('', bound) or right[1:2] in ('', bound)):
                     return True
 
             if aff.CHECKCOMPOUNDCASE:
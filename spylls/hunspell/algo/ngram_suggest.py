@@ -14,7 +14,7 @@ Scoring
 
 """
 
-from typing import Iterator, Tuple, List, Set, Dict
+from typing import Iterator, Tuple, List, Set, Dict, Optional
 from operator import itemgetter
 import heapq
 
@@ -24,6 +24,7 @@ import spylls.hunspell.algo.string_metrics as sm
 
 MAX_ROOTS = 100
 MAX_GUESSES = 200
+MAX_LENGTH_DIFF = 4
 
 
 def ngram_suggest(misspelling: str, *,
@@ -31,7 +32,8 @@ def ngram_suggest(misspelling: str, *,
                   prefixes: Dict[str, List[data.aff.Prefix]],
                   suffixes: Dict[str, List[data.aff.Suffix]],
                   known: Set[str], maxdiff: int, onlymaxdiff: bool = False,
-                  has_phonetic: bool = False) -> Iterator[str]:
+                  has_phonetic: bool = False,
+                  lowercased_stems: Optional[List[str]] = None) -> Iterator[str]:
     """
     Try to suggest all possible variants for misspelling based on ngram-similarity.
 
@@ -58,30 +60,44 @@ def ngram_suggest(misspelling: str, *,
         has_phonetic: whether there are :attr:`Aff.PHONE <spylls.hunspell.data.aff.Aff.PHONE>`
                       definitions present (it changes ngram thresholds a bit, in order to produce
                       less ngrams)
+        lowercased_stems: ``word.stem.lower()`` for each of ``dictionary_words`` (they are the same
+                          for every misspelling, so the caller may calculate them once)
     """
 
     root_scores: List[Tuple[float, data.dic.Word]] = []
 
+    misspelling_len = len(misspelling)
+
     # First, find MAX_ROOTS candidate dictionary entries, by calculating stem score against the
     # misspelled word.
-    for word in dictionary_words:
-        if abs(len(word.stem) - len(misspelling)) > 4:
+    if lowercased_stems is None:
+        lowercased_stems = [word.stem.lower() for word in dictionary_words]
+
+    for word, lowercased_stem in zip(dictionary_words, lowercased_stems):
+        # Stems with too different length are never considered, so we don't even calculate the score
+        # for them (that's the only early exit available: all other candidates need a full score,
+        # to keep MAX_ROOTS best ones).
+        if abs(len(word.stem) - misspelling_len) > MAX_LENGTH_DIFF:
             continue
 
         # TODO: hunspell has more exceptions/flag checks here (part of it we cover later in suggest,
         # deciding, for example, if the suggestion is forbidden)
 
-        score = root_score(misspelling, word.stem)
+        score = root_score(misspelling, lowercased_stem)
 
         # If dictionary word have alternative spellings provided via `pp:` data tag, calculate
         # score against them, too. Note that only simple ph:spelling are listed in alt_spellings,
         # more complicated tags like ph:spellin* or ph:spellng->spelling are ignored in ngrams
         if word.alt_spellings:
             for variant in word.alt_spellings:
-                score = max(score, root_score(misspelling, variant))
+                score = max(score, root_score(misspelling, variant.lower()))
 
         # Pythons stdlib heapq used to always keep only MAX_ROOTS of best results
         if len(root_scores) > MAX_ROOTS:
+            # Most of the words are worse than the worst of kept ones, and heappushpop would just
+            # return them back; checking it here avoids building the tuple and the call
+            if score < root_scores[0][0]:
+                continue
             heapq.heappushpop(root_scores, (score, word))
         else:
             heapq.heappush(root_scores, (score, word))
@@ -146,12 +162,12 @@ def root_score(word1: str, word2: str) -> float:
 
     Args:
         word1: misspelled word
-        word2: possible suggestion
+        word2: possible suggestion (lowercased)
     """
 
     return (
-        sm.ngram(3, word1, word2.lower(), longer_worse=True) +
-        sm.leftcommonsubstring(word1, word2.lower())
+        sm.ngram(3, word1, word2, longer_worse=True) +
+        sm.leftcommonsubstring(word1, word2)
     )
 
 
@@ -290,13 +306,13 @@ def forms_for(word: data.dic.Word, all_prefixes, all_suffixes, *, similar_to: st
         suffix
         for flag in word.flags
         for suffix in all_suffixes.get(flag, [])
-        if suffix.cond_regexp.search(word.stem) and similar_to.endswith(suffix.add)
+        if suffix.condition_matches(word.stem) and similar_to.endswith(suffix.add)
     ]
     prefixes = [
         prefix
         for flag in word.flags
         for prefix in all_prefixes.get(flag, [])
-        if prefix.cond_regexp.search(word.stem) and similar_to.startswith(prefix.add)
+        if prefix.condition_matches(word.stem) and similar_to.startswith(prefix.add)
     ]
 
     cross = [
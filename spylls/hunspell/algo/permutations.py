@@ -1,6 +1,9 @@
 """
 Note: names of methods in this module, if seem weird, are the same as in Hunspell's ``suggest.cxx``
 to keep track of them.
+
+All of the methods are generators: :meth:`Suggest.edits <spylls.hunspell.algo.suggest.Suggest.edits>`
+chains them lazily, so when enough suggestions are found, the rest of permutations are never produced.
 """
 
 from typing import Iterator, Union, List, Set
@@ -23,9 +26,12 @@ def replchars(word: str, reptable: List[aff.RepPattern]) -> Iterator[Union[str,
         return
 
     for pattern in reptable:
-        # TODO: compiled at aff loading
-        for match in pattern.regexp.finditer(word):
-            suggestion = word[:match.start()] + pattern.replacement.replace('_', ' ') + word[match.end():]
+        # Most of the patterns are plain texts, and most of them aren't in the word at all: this is
+        # checked before running a search for their exact positions.
+        if pattern.text is not None and pattern.text not in word:
+            continue
+        for start, end in pattern.spans(word):
+            suggestion = word[:start] + pattern.substitution + word[end:]
             yield suggestion
             if ' ' in suggestion:
                 yield suggestion.split(' ', 2)
@@ -57,10 +63,13 @@ def mapchars(word: str, maptable: List[Set[str]]) -> Iterator[str]:
     if len(word) < 2 or not maptable:
         return
 
-    def mapchars_internal(word, start=0):
+    # All words produced by replacing one of the related chars found in the word after ``start``,
+    # each with the position to continue replacing from
+    def expansions(word, start):
         if start >= len(word):
-            return
+            return []
 
+        result = []
         for options in maptable:
             for option in options:
                 pos = word.find(option, start)
@@ -68,12 +77,16 @@ def mapchars(word: str, maptable: List[Set[str]]) -> Iterator[str]:
                     for other in options:
                         if other == option:
                             continue
-                        replaced = word[:pos] + other + word[pos+len(option):]
-                        yield replaced
-                        for variant in mapchars_internal(replaced, pos + 1):
-                            yield variant
+                        result.append((word[:pos] + other + word[pos+len(option):], pos + 1))
+        return result
 
-    yield from mapchars_internal(word)
+    # Depth-first walk with an explicit stack (instead of recursive generators), children are pushed
+    # in reverse, so variants are produced in the same order as recursion would produce them.
+    stack = expansions(word, 0)[::-1]
+    while stack:
+        replaced, start = stack.pop()
+        yield replaced
+        stack.extend(reversed(expansions(replaced, start)))
 
 
 def swapchar(word: str) -> Iterator[str]:
@@ -82,18 +95,21 @@ def swapchar(word: str) -> Iterator[str]:
     also doubleswaps: ahev -> have.
     """
 
-    if len(word) < 2:
+    length = len(word)
+
+    if length < 2:
         return
 
-    for i in range(len(word) - 1):
+    for i in range(length - 1):
         yield word[:i] + word[i+1] + word[i] + word[i+2:]
 
     # try double swaps for short words
     # ahev -> have, owudl -> would
-    if len(word) in [4,  5]:
-        yield word[1] + word[0] + (word[2] if len(word) == 5 else '') + word[-1] + word[-2]
-        if len(word) == 5:
-            yield word[0] + word[2] + word[1] + word[-1] + word[-2]
+    if length == 4:
+        yield word[1] + word[0] + word[-1] + word[-2]
+    elif length == 5:
+        yield word[1] + word[0] + word[2] + word[-1] + word[-2]
+        yield word[0] + word[2] + word[1] + word[-1] + word[-2]
 
 
 def longswapchar(word: str) -> Iterator[str]:
@@ -101,8 +117,10 @@ def longswapchar(word: str) -> Iterator[str]:
     Produces permutations with non-adjacent chars swapped (up to 4 chars distance)
     """
 
-    for first in range(len(word) - 2):
-        for second in range(first + 2, min(first + MAX_CHAR_DISTANCE, len(word))):
+    length = len(word)
+
+    for first in range(length - 2):
+        for second in range(first + 2, min(first + MAX_CHAR_DISTANCE, length)):
             yield word[:first] + word[second] + word[first+1:second] + word[first] + word[second+1:]
 
 
@@ -114,11 +132,14 @@ def badcharkey(word: str, layout: str) -> Iterator[str]:
     Uses :attr:`aff.KEY <spylls.hunspell.data.aff.Aff.KEY>`
     """
 
+    layout_len = len(layout)
+
     for i, c in enumerate(word):
         before = word[:i]
         after = word[i+1:]
-        if c != c.upper():
-            yield before + c.upper() + after
+        upper = c.upper()
+        if c != upper:
+            yield before + upper + after
 
         if not layout:
             continue
@@ -127,7 +148,7 @@ def badcharkey(word: str, layout: str) -> Iterator[str]:
         while pos != -1:
             if pos > 0 and layout[pos-1] != '|':
                 yield before + layout[pos-1] + after
-            if pos + 1 < len(layout) and layout[pos+1] != '|':
+            if pos + 1 < layout_len and layout[pos+1] != '|':
                 yield before + layout[pos+1] + after
             pos = layout.find(c, pos+1)
 
@@ -140,6 +161,10 @@ def extrachar(word: str) -> Iterator[str]:
         return
 
     for i in range(len(word)):
+        # Removing any char of a run of the same chars produces the same string, there is no need
+        # to build (and then check) it again: "aab" => "ab" only once
+        if i > 0 and word[i] == word[i-1]:
+            continue
         yield word[:i] + word[i+1:]
 
 
@@ -155,9 +180,17 @@ def forgotchar(word: str, trystring: str) -> Iterator[str]:
     if not trystring:
         return
 
+    # Word is split once into all (before, after) pairs, so only the final concatenation is done
+    # per candidate
+    splits = [(word[:i], word[i:]) for i in range(len(word) + 1)]
+
     for c in trystring:
-        for i in range(len(word) + 1):
-            yield word[:i] + c + word[i:]
+        for before, after in splits:
+            # Inserting the char right after the same char produces the same string as inserting it
+            # right before, which was already yielded: "ab" + "a" => "aab" only once
+            if before[-1:] == c:
+                continue
+            yield before + c + after
 
 
 def movechar(word: str) -> Iterator[str]:
@@ -166,14 +199,16 @@ def movechar(word: str) -> Iterator[str]:
     because it is already handled by :meth:`swapchar`)
     """
 
-    if len(word) < 2:
+    length = len(word)
+
+    if length < 2:
         return
 
     for frompos, char in enumerate(word):
-        for topos in range(frompos + 3, min(len(word), frompos + MAX_CHAR_DISTANCE + 1)):
+        for topos in range(frompos + 3, min(length, frompos + MAX_CHAR_DISTANCE + 1)):
             yield word[:frompos] + word[frompos+1:topos] + char + word[topos:]
 
-    for frompos in reversed(range(len(word))):
+    for frompos in reversed(range(length)):
         for topos in reversed(range(max(0, frompos - MAX_CHAR_DISTANCE + 1), frompos - 1)):
             yield word[:topos] + word[frompos] + word[topos:frompos] + word[frompos+1:]
 
@@ -187,11 +222,14 @@ def badchar(word: str, trystring: str) -> Iterator[str]:
     if not trystring:
         return
 
+    # Same as in forgotchar: split once, (before, replaced char, after), and only join per candidate
+    splits = [(word[:i], word[i], word[i+1:]) for i in reversed(range(len(word)))]
+
     for c in trystring:
-        for i in reversed(range(len(word))):
-            if word[i] == c:
+        for before, char, after in splits:
+            if char == c:
                 continue
-            yield word[:i] + c + word[i+1:]
+            yield before + c + after
 
 
 def doubletwochars(word: str) -> Iterator[str]:
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Iterator, List, Tuple
+from typing import Iterator, Iterable, List, Tuple
 from operator import itemgetter
 import heapq
 
@@ -10,9 +10,10 @@ import spylls.hunspell.algo.string_metrics as sm
 import spylls.hunspell.algo.ngram_suggest as ng
 
 MAX_ROOTS = 100
+MAX_LENGTH_DIFF = 3
 
 
-def phonet_suggest(misspelling: str, *, dictionary_words: List[dic.Word], table: aff.PhonetTable) -> Iterator[str]:
+def phonet_suggest(misspelling: str, *, dictionary_words: Iterable[dic.Word], table: aff.PhonetTable) -> Iterator[str]:
     """
     Phonetical suggestion algorithm provides suggestions based on phonetical (prononication) similarity.
     It requires .aff file to define :attr:`PHONE <spylls.hunspell.data.aff.Aff.PHONE>` table --
@@ -33,7 +34,8 @@ def phonet_suggest(misspelling: str, *, dictionary_words: List[dic.Word], table:
 
     Args:
         misspelling: Misspelled word
-        dictionary_words: All words from dictionary (only stems are used)
+        dictionary_words: All words from dictionary (only stems are used); caller may pass only those
+                          with stem length close to misspelling's, others are skipped anyway
         table: Table for metaphone producing
     """
 
@@ -52,15 +54,15 @@ def phonet_suggest(misspelling: str, *, dictionary_words: List[dic.Word], table:
     # Considering extreme rarity of metaphone-enabled dictionaries, and "educational" goal of
     # spylls, we split it out.
     for word in dictionary_words:
-        if abs(len(word.stem) - len(misspelling)) > 3:
+        if abs(len(word.stem) - len(misspelling)) > MAX_LENGTH_DIFF:
             continue
 
         # First, we calculate "regular" similarity score, just like in ngram_suggest
-        nscore = ng.root_score(misspelling, word.stem)
+        nscore = ng.root_score(misspelling, word.stem.lower())
 
         if word.alt_spellings:
             for variant in word.alt_spellings:
-                nscore = max(nscore, ng.root_score(misspelling, variant))
+                nscore = max(nscore, ng.root_score(misspelling, variant.lower()))
 
         if nscore <= 2:
             continue
@@ -114,13 +116,10 @@ def metaphone(table: aff.PhonetTable, word: str) -> str:
     # for rules. To see what _potentially_ should been done, look at aspell's original description:
     # http://aspell.net/man-html/Phonetic-Code.html
     while pos < len(word):
-        match = None
-        for rule in table.rules[word[pos]]:
-            match = rule.match(word, pos)
-            if match:
-                res += rule.replacement
-                pos += match.span()[1] - match.span()[0]
-                break
-        if not match:
+        found = table.match_at(word, pos)
+        if found:
+            rule, pos = found
+            res += rule.replacement
+        else:
             pos += 1
     return res
@@ -44,8 +44,9 @@ def ngram(max_ngram_size: int, s1: str, s2: str, *,
     # For all sizes of ngram up to desired...
     for ngram_size in range(1, max_ngram_size + 1):
         ns = 0
+        last = l1 - ngram_size
         # Check every position in the first string
-        for pos in range(l1 - ngram_size + 1):
+        for pos in range(last + 1):
             # ...and if the ngram of current size in this position is present in ANY place in second string
             if s1[pos:pos+ngram_size] in s2:
                 # increase score
@@ -53,7 +54,7 @@ def ngram(max_ngram_size: int, s1: str, s2: str, *,
             elif weighted:
                 # For "weighted" ngrams, decrease score if ngram is not found,
                 ns -= 1
-                if pos == 0 or pos + ngram_size == l1:
+                if pos == 0 or pos == last:
                     # ...and decrease once more if it was the beginning or end of first string
                     ns -= 1
         nscore += ns
@@ -77,20 +78,24 @@ def lcslen(s1: str, s2: str) -> int:
     """
     Classic "LCS (longest common subsequence) length" algorithm.
     This implementation is stolen shamelessly from https://gist.github.com/cgt/c0c47c100efda1d11854
+    (and then reduced to keeping only two rows of the table at a time).
     """
 
-    m = len(s1)
     n = len(s2)
 
-    c = [[0 for j in range(n+1)] for i in range(m+1)]
+    # Only the previous row of the classic (len(s1) x len(s2)) table is necessary to calculate the
+    # next one. Each row has an extra trailing zero, so ``row[j-1]`` for ``j == 0`` reads it.
+    prev = [0] * (n + 1)
 
-    for i in range(m):
-        for j in range(n):
-            if s1[i] == s2[j]:
-                c[i][j] = c[i-1][j-1] + 1
-            elif c[i-1][j] >= c[i][j-1]:
-                c[i][j] = c[i-1][j]
+    for c1 in s1:
+        cur = [0] * (n + 1)
+        for j, c2 in enumerate(s2):
+            if c1 == c2:
+                cur[j] = prev[j-1] + 1
             else:
-                c[i][j] = c[i][j-1]
+                up = prev[j]
+                left = cur[j-1]
+                cur[j] = up if up >= left else left
+        prev = cur
 
-    return c[m-1][n-1]
+    return prev[n-1]
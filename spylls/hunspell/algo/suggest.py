@@ -37,9 +37,11 @@ Suggestion classes
 
 """
 
-from typing import Iterator, List, Set, Union
+from typing import Iterator, List, Set, FrozenSet, Dict, Optional, Union
 
-import dataclasses
+import itertools
+import functools
+from collections import defaultdict
 from dataclasses import dataclass
 
 from spylls.hunspell import data
@@ -58,6 +60,9 @@ class Suggestion:
     to make sure it is a good one.
     """
 
+    # There are lots of them created while producing edits (one per candidate), so no per-instance __dict__
+    __slots__ = ('text', 'kind')
+
     #: Actual suggestion text
     text: str
     #: How suggestion was produced, useful for debugging, typically same as the method
@@ -68,7 +73,8 @@ class Suggestion:
         return f"Suggestion[{self.kind}]({self.text})"
 
     def replace(self, **changes):
-        return dataclasses.replace(self, **changes)
+        # Cheaper than dataclasses.replace, which introspects fields on each call
+        return Suggestion(**{'text': self.text, 'kind': self.kind, **changes})
 
 
 @dataclass
@@ -128,10 +134,25 @@ class Suggest:
         self.dic = dic
         self.lookup = lookup
 
-        # TODO: also NONGRAMSUGGEST and ONLYUPCASE
-        bad_flags = {*filter(None, [self.aff.FORBIDDENWORD, self.aff.NOSUGGEST, self.aff.ONLYINCOMPOUND])}
+        # Words for ngram and phonetic suggestions (and their indexes) are prepared on the first use:
+        # most misspellings are fixed by edits, and for them walking through the whole dictionary
+        # is never necessary. See words_for_ngram and related properties.
+        self._words_for_ngram: Optional[List[data.dic.Word]] = None
+        self._words_for_ngram_lowercased: Optional[List[str]] = None
+        self._words_for_ngram_by_length: Optional[Dict[int, List[data.dic.Word]]] = None
+
+        # Sets of stems consulted for every suggestion (see plain_stems and related properties) also
+        # need a walk through the whole dictionary, so they are prepared on the first use, too.
+        self._plain_stems: Optional[FrozenSet[str]] = None
+        self._forbidden_stems: Optional[FrozenSet[str]] = None
+        self._keepcase_stems: Optional[FrozenSet[str]] = None
 
-        self.words_for_ngram = [word for word in self.dic.words if not bad_flags.intersection(word.flags)]
+        # Depends only on TRY, but consulted for every split of every edited word
+        self.dash_allowed = self.use_dash()
+
+        # The same misspelling is frequently suggested for several times (each occurrence in the
+        # checked text), and its capitalization hypotheses are always the same
+        self.casing_corrections = functools.lru_cache(maxsize=256)(self.aff.casing.corrections)
 
     def __call__(self, word: str) -> Iterator[str]:
         """
@@ -176,46 +197,63 @@ class Suggest:
             word: Word to check
         """
 
+        # Results of is_good_suggestion: the same word might be checked several times (as a
+        # FORCEUCASE capitalization, as a capitalization variant, as a dashed word chunk)
+        good_words: Dict[str, bool] = {}
+
         # Whether some suggestion (permutation of the word) is an existing and allowed word,
         # just delegates to Lookup
         def is_good_suggestion(word):
-            # Note that instead of using Lookup's main method, we just see if there is any good forms
-            # of this exact word, avoiding ICONV and trying to break word by dashes.
-            return any(self.lookup.good_forms(word, capitalization=False, allow_nosuggest=False))
+            if word not in good_words:
+                # Note that instead of using Lookup's main method, we just see if there is any good forms
+                # of this exact word, avoiding ICONV and trying to break word by dashes.
+                good_words[word] = word in self.plain_stems or \
+                    any(self.lookup.good_forms(word, capitalization=False, allow_nosuggest=False))
+            return good_words[word]
 
         # The suggestion is considered forbidden if there is ANY homonym in dictionary with flag
         # FORBIDDENWORD. Besides marking swearing words, this feature also allows to include in
         # dictionaries known "correctly-looking but actually non-existent" forms, which might important
         # with very flexive languages.
         def is_forbidden(word):
-            return self.aff.FORBIDDENWORD and self.dic.has_flag(word, self.aff.FORBIDDENWORD)
+            return word in self.forbidden_stems
 
         # This set will gather all good suggestions that were already returned (in order, for example,
         # to not return same suggestion twice)
         handled: Set[str] = set()
+        # ...and the same suggestions lowercased, for checking inclusion without lowercasing every
+        # one of them again on each check (and for passing to ngram_suggest as is)
+        handled_lower: Set[str] = set()
 
         # Suggestions that are already considered good are passed through this method, which converts
         # it to proper capitalization form, and then either yields it (if it is not forbidden,
         # hadn't already seen, etc), or just does nothing.
         # Method is quite lengthy, but is nested because updates and reuses ``handled`` local var
+        #
+        # It is called for each and every suggestion found, so the settings it needs are fetched once:
+        casing = self.aff.casing
+        oconv = self.aff.OCONV
+        checksharps = self.aff.CHECKSHARPS
+        keepcase_stems = self.keepcase_stems
+
         def handle_found(suggestion, *, check_inclusion=False):
             text = suggestion.text
 
             # If any of the homonyms has KEEPCASE flag, we shouldn't coerce it from the base form.
             # But CHECKSHARPS flag presence changes the meaning of KEEPCASE...
-            if (self.aff.KEEPCASE and self.dic.has_flag(text, self.aff.KEEPCASE) and not
-                    (self.aff.CHECKSHARPS and 'ß' in text)):
+            if text in keepcase_stems and not (checksharps and 'ß' in text):
                 # Don't try to change text's case
                 pass
             else:
                 # "Coerce" suggested text from the capitalization that it has in the dictionary, to
                 # the capitalization of the misspelled word. E.g., if misspelled was "Kiten", suggestion
                 # is "kitten" (how it is in the dictionary), and coercion (what we really want
-                # to return to user) is "Kitten"
-                text = self.aff.casing.coerce(text, captype)
-                # ...but if this particular capitalized form is forbidden, return back to original text
-                if text != suggestion.text and is_forbidden(text):
-                    text = suggestion.text
+                # to return to user) is "Kitten". Lowercase misspelling doesn't change anything.
+                if captype != CapType.NO:
+                    text = casing.coerce(text, captype)
+                    # ...but if this particular capitalized form is forbidden, return back to original text
+                    if text != suggestion.text and is_forbidden(text):
+                        text = suggestion.text
 
                 # "aNew" will suggest "a new", here we fix it back to "a New"
                 if captype in [CapType.HUH, CapType.HUHINIT] and ' ' in text:
@@ -229,7 +267,7 @@ class Suggest:
 
             # Finally, OCONV table in .aff-file might specify what chars to replace in suggestions
             # (for example, "'" to proper typographic "’", or common digraphs)
-            text = self.aff.OCONV(text) if self.aff.OCONV else text
+            text = oconv(text) if oconv else text
 
             # If we already seen this suggestion, nothing to do
             # Note that this should happen AFTER the OCONV: it sometimes changes the content significantly.
@@ -242,11 +280,13 @@ class Suggest:
             # seen ones: for examle, ngram-based suggestions might produce very similar forms, like
             # "impermanent" and "permanent" -- both of them are correct, but if the first is
             # closer (by length/content) to misspelling, there is no point in suggesting the second
-            if check_inclusion and any(previous.lower() in text.lower() for previous in handled):
+            text_lower = text.lower()
+            if check_inclusion and any(previous in text_lower for previous in handled_lower):
                 return
 
             # Remember we seen it
             handled.add(text)
+            handled_lower.add(text_lower)
 
             # And here we are!
             yield suggestion.replace(text=text)
@@ -258,7 +298,7 @@ class Suggest:
         # "msdonalds" (full lowercase) "msDonalds" (first letter lowercased), or maybe "Msdonalds"
         # (only first letter capitalized). Note that "MSDONALDS" (it should've been all caps) is not
         # produced as a possible good form, but checked separately in ``edits``
-        captype, variants = self.aff.casing.corrections(word)
+        captype, variants = self.casing_corrections(word)
 
         # Check a special case: if it is possible that words would be possible to be capitalized
         # on compounding, then we check capitalized form of the word. If it is correct, that's the
@@ -271,6 +311,16 @@ class Suggest:
 
         good_edits_found = False
 
+        # Edits of different capitalization variants (and different edits of the same variant) frequently
+        # produce the same candidate words; each candidate is checked only once per round (non-compound
+        # and compound), as checking it again can't produce a new suggestion. Parts of multi-word
+        # suggestions repeat even more often ("alot" => "a lot", "Alot" => "A lot"), and results of their
+        # checks are remembered for the round.
+        checked: Set[str] = set()
+        checked_compounds: Set[str] = set()
+        word_checks: Dict[str, bool] = {}
+        word_checks_compounds: Dict[str, bool] = {}
+
         # Now, for all capitalization variant
         for idx, variant in enumerate(variants):
             # If it is different from original capitalization, and is good, we suggest it
@@ -293,7 +343,8 @@ class Suggest:
             nocompound = False
 
             # 1. Only generate suggestions that are correct NOT COMPOUND words.
-            for suggestion in self.edit_suggestions(variant, handle_found, limit=MAXSUGGESTIONS, compounds=False):
+            for suggestion in self.edit_suggestions(variant, handle_found, limit=MAXSUGGESTIONS, compounds=False,
+                                                    checked=checked, word_checks=word_checks):
                 yield suggestion
                 # remember if any "good" edits was found -- in this case we don't need
                 # ngram suggestions
@@ -311,7 +362,9 @@ class Suggest:
             # 2. Only generate suggestions that are correct COMPOUND words
             if not nocompound:
                 for suggestion in self.edit_suggestions(variant, handle_found,
-                                                        limit=self.aff.MAXCPDSUGS, compounds=True):
+                                                        limit=self.aff.MAXCPDSUGS, compounds=True,
+                                                        checked=checked_compounds,
+                                                        word_checks=word_checks_compounds):
                     yield suggestion
                     good_edits_found = good_edits_found or (suggestion.kind in GOOD_EDITS)
 
@@ -325,9 +378,12 @@ class Suggest:
             for idx, chunk in enumerate(chunks):
                 # If this chunk of the word is misspelled...
                 if not is_good_suggestion(chunk):
-                    # ...try all suggestions for this separate chunk
+                    # ...try all suggestions for this separate chunk, putting each of them between
+                    # the same (once joined) other chunks
+                    before = ''.join(prev + '-' for prev in chunks[:idx])
+                    after = ''.join('-' + next_ for next_ in chunks[idx+1:])
                     for sug in self(chunk):
-                        candidate = '-'.join([*chunks[:idx], sug, *chunks[idx+1:]])
+                        candidate = before + sug + after
                         # And check if the whole word with this chunk replaced is a good word. Note that
                         # we use lookup's main method here, which will also break it into words by
                         # dashes. It is done (instead of just checking chunk-by-chunk), because there
@@ -344,7 +400,9 @@ class Suggest:
         # ngram-based suggestion algorithm: it is slower, but able to correct severely misspelled words
 
         ngrams_seen = 0
-        for sug in self.ngram_suggestions(word, handled=handled):
+        # ngram_suggest receives a copy: the suggestions handled *after* it is called shouldn't
+        # affect its filtering
+        for sug in self.ngram_suggestions(word, handled=handled_lower.copy()):
             for res in handle_found(Suggestion(sug, 'ngram'), check_inclusion=True):
                 ngrams_seen += 1
                 yield res
@@ -362,13 +420,32 @@ class Suggest:
             if phonet_seen >= MAXPHONSUGS:
                 break
 
-    def edit_suggestions(self, word: str, handle_found, *, compounds: bool, limit: int) -> Iterator[Suggestion]:
+    def edit_suggestions(self, word: str, handle_found, *, compounds: bool, limit: int,
+                         checked: Optional[Set[str]] = None,
+                         word_checks: Optional[Dict[str, bool]] = None) -> Iterator[Suggestion]:
+        if checked is None:
+            checked = set()
+        if word_checks is None:
+            word_checks = {}
+
+        # All the candidates produced by edits are checked with the same settings; there is no work
+        # that could be shared between lookups of different words, but the lookups themselves are
+        # fetched once for all of them.
+        plain_stems = self.plain_stems
+        good_forms = self.lookup.good_forms
+
         def is_good_suggestion(word):
             # Note that instead of using Lookup's main method, we just see if there is any good forms
             # of this exact word, avoiding ICONV and trying to break word by dashes.
             if compounds:
-                return any(self.lookup.good_forms(word, capitalization=False, allow_nosuggest=False, affix_forms=False))
-            return any(self.lookup.good_forms(word, capitalization=False, allow_nosuggest=False, compound_forms=False))
+                return any(good_forms(word, capitalization=False, allow_nosuggest=False, affix_forms=False))
+            return word in plain_stems or \
+                any(good_forms(word, capitalization=False, allow_nosuggest=False, compound_forms=False))
+
+        def is_good_part(word):
+            if word not in word_checks:
+                word_checks[word] = is_good_suggestion(word)
+            return word_checks[word]
 
         # For some set of suggestions, produces only good ones:
         def filter_suggestions(suggestions):
@@ -376,13 +453,17 @@ class Suggest:
                 # For multiword suggestion,
                 if isinstance(suggestion, MultiWordSuggestion):
                     # ...if all of the words is correct
-                    if all(is_good_suggestion(word) for word in suggestion.words):
+                    if all(is_good_part(word) for word in suggestion.words):
                         # ...we just convert it to plain text suggestion "word1 word2"
                         yield suggestion.stringify()
                         if suggestion.allow_dash:
                             # ...and "word1-word2" if allowed
                             yield suggestion.stringify('-')
                 else:
+                    # Candidates already checked (and either suggested or rejected) are skipped
+                    if suggestion.text in checked:
+                        continue
+                    checked.add(suggestion.text)
                     # Singleword suggestion is just yielded if it is good
                     if is_good_suggestion(suggestion.text):
                         yield suggestion
@@ -398,6 +479,8 @@ class Suggest:
                 yield res
                 count += 1
 
+                # Stopping here also stops the whole (lazy) chain of edits: nothing more would be
+                # generated or checked
                 if count > limit:
                     return
 
@@ -412,6 +495,9 @@ class Suggest:
         * suggestion "source" tag is important: :meth:`suggestions` uses it to distinguish between
           good and questionble edits (if there were any good ones, ngram suggestion wouldn't
           be used)
+        * the method, as well as all of the :mod:`permutations <spylls.hunspell.algo.permutations>`,
+          is a lazy generator: edits of the next type aren't even produced if the consumer has already
+          found enough suggestions
 
         Args:
             word: Word to mutate
@@ -436,12 +522,18 @@ class Suggest:
             else:
                 yield Suggestion(suggestion, 'replchars')
 
-        for words in pmt.twowords(word):
-            yield Suggestion(' '.join(words), 'spaceword')
+        # All the ways to split the word in two are needed twice (here, and for checking as separate
+        # words below), so they are produced once
+        splits = [*pmt.twowords(word)]
 
-            if self.use_dash():
+        if self.dash_allowed:
+            for words in splits:
+                yield Suggestion(' '.join(words), 'spaceword')
                 # "alot" => "a-lot"
                 yield Suggestion('-'.join(words), 'spaceword')
+        else:
+            for words in splits:
+                yield Suggestion(' '.join(words), 'spaceword')
 
         # MAP in aff file specifies related chars (for example, "ïi"), and mapchars produces all
         # changes of the word with related chars replaced. For example, "naive" produces "naïve".
@@ -490,8 +582,8 @@ class Suggest:
         if not self.aff.NOSPLITSUGS:
             # Try split word by space in all possible positions
             # NOSPLITSUGS option in aff prohibits it, it is important, say, for Scandinavian languages
-            for suggestion_pair in pmt.twowords(word):
-                yield MultiWordSuggestion(suggestion_pair, 'twowords', allow_dash=self.use_dash())
+            for suggestion_pair in splits:
+                yield MultiWordSuggestion(suggestion_pair, 'twowords', allow_dash=self.dash_allowed)
 
     def ngram_suggestions(self, word: str, handled: Set[str]) -> Iterator[str]:
         """
@@ -503,7 +595,7 @@ class Suggest:
 
         Args:
             word: Misspelled word
-            handled: List of already handled (known) suggestions; it is reused in
+            handled: List of already handled (known) suggestions, lowercased; it is reused in
                      :meth:`ngram_suggest.filter_guesses <spylls.hunspell.algo.ngram_suggest.filter_guesses>`
                      to decide whether we add "not really good" ngram-based suggestions to result
         """
@@ -514,10 +606,11 @@ class Suggest:
                     word.lower(),
                     dictionary_words=self.words_for_ngram,
                     prefixes=self.aff.PFX, suffixes=self.aff.SFX,
-                    known={*(word.lower() for word in handled)},
+                    known=handled,
                     maxdiff=self.aff.MAXDIFF,
                     onlymaxdiff=self.aff.ONLYMAXDIFF,
-                    has_phonetic=(self.aff.PHONE is not None))
+                    has_phonetic=(self.aff.PHONE is not None),
+                    lowercased_stems=self.words_for_ngram_lowercased)
 
     def phonet_suggestions(self, word: str) -> Iterator[str]:
         """
@@ -533,7 +626,91 @@ class Suggest:
         if not self.aff.PHONE:
             return
 
-        yield from phonet_suggest.phonet_suggest(word, dictionary_words=self.words_for_ngram, table=self.aff.PHONE)
+        length = len(word.lower())
+        maxdiff = phonet_suggest.MAX_LENGTH_DIFF
+        candidates = itertools.chain.from_iterable(
+            self.words_for_ngram_by_length.get(stem_length, [])
+            for stem_length in range(length - maxdiff, length + maxdiff + 1)
+        )
+
+        yield from phonet_suggest.phonet_suggest(word, dictionary_words=candidates, table=self.aff.PHONE)
+
+    @property
+    def words_for_ngram(self) -> List[data.dic.Word]:
+        """
+        All dictionary words that can be suggested by ngram and phonetic similarity.
+        """
+        if self._words_for_ngram is None:
+            # TODO: also NONGRAMSUGGEST and ONLYUPCASE
+            bad_flags = frozenset(filter(None, [self.aff.FORBIDDENWORD, self.aff.NOSUGGEST, self.aff.ONLYINCOMPOUND]))
+            self._words_for_ngram = [word for word in self.dic.words if bad_flags.isdisjoint(word.flags)]
+        return self._words_for_ngram
+
+    @property
+    def words_for_ngram_lowercased(self) -> List[str]:
+        """
+        Lowercased stems of :attr:`words_for_ngram` (in the same order), used by ngram_suggest for
+        scoring against each misspelling.
+        """
+        if self._words_for_ngram_lowercased is None:
+            self._words_for_ngram_lowercased = [word.stem.lower() for word in self.words_for_ngram]
+        return self._words_for_ngram_lowercased
+
+    @property
+    def words_for_ngram_by_length(self) -> Dict[int, List[data.dic.Word]]:
+        """
+        :attr:`words_for_ngram` grouped by stem length: phonet_suggest only considers stems of the
+        length close to misspelling's, so there is no need to walk through the whole dictionary.
+        """
+        if self._words_for_ngram_by_length is None:
+            self._words_for_ngram_by_length = defaultdict(list)
+            for word in self.words_for_ngram:
+                self._words_for_ngram_by_length[len(word.stem)].append(word)
+        return self._words_for_ngram_by_length
+
+    @property
+    def plain_stems(self) -> FrozenSet[str]:
+        """
+        Stems that are good suggestions by themselves, without any affixes: their flags don't
+        prohibit it (and don't require checking capitalization). If the permutation is one of them,
+        we don't need to ask Lookup. It is only a shortcut for "yes": everything else (including
+        stems with those flags) still goes through Lookup.
+        """
+        if self._plain_stems is None:
+            not_plain_flags = frozenset(filter(None, [self.aff.FORBIDDENWORD, self.aff.NOSUGGEST,
+                                                      self.aff.ONLYINCOMPOUND, self.aff.NEEDAFFIX,
+                                                      self.aff.KEEPCASE]))
+            self._plain_stems = frozenset(word.stem for word in self.dic.words
+                                          if not_plain_flags.isdisjoint(word.flags))
+        return self._plain_stems
+
+    @property
+    def forbidden_stems(self) -> FrozenSet[str]:
+        """
+        Stems that have at least one homonym with FORBIDDENWORD flag: same as
+        ``dic.has_flag(stem, flag)``, but checked for each and every found suggestion, so precalculated
+        """
+        if self._forbidden_stems is None:
+            self._forbidden_stems = self.stems_with_flag(self.aff.FORBIDDENWORD)
+        return self._forbidden_stems
+
+    @property
+    def keepcase_stems(self) -> FrozenSet[str]:
+        """
+        Stems that have at least one homonym with KEEPCASE flag (see :attr:`forbidden_stems`).
+        """
+        if self._keepcase_stems is None:
+            self._keepcase_stems = self.stems_with_flag(self.aff.KEEPCASE)
+        return self._keepcase_stems
+
+    def stems_with_flag(self, flag: Optional[str]) -> FrozenSet[str]:
+        """
+        Set of all stems that have at least one homonym with the flag (empty if the flag is not
+        defined in .aff file).
+        """
+        if not flag:
+            return frozenset()
+        return frozenset(word.stem for word in self.dic.words if flag in word.flags)
 
     def use_dash(self) -> bool:
         """
@@ -1,10 +1,15 @@
-from collections import defaultdict
+# Shared by all the leaves that have no payloads (most of the intermediate ones)
+NO_PAYLOADS = ()
 
 
 class Leaf:     # pylint: disable=too-few-public-methods,missing-class-docstring
+    # There are a lot of leaves in affix tries, and most of them have no children: no per-instance
+    # __dict__, and children dictionary is created only when the first child is added.
+    __slots__ = ('payloads', 'children')
+
     def __init__(self):
-        self.payloads = []
-        self.children = defaultdict(Leaf)
+        self.payloads = NO_PAYLOADS
+        self.children = None
 
 
 class Trie:
@@ -27,6 +32,10 @@ class Trie:
     Spylls performance, that's why it is very primitive and fast implementation instead of some
     library like `pygtrie <https://github.com/google/pygtrie>`_. Probably, by choosing fast (C)
     implementation of trie, the whole spylls can be make much faster.
+
+    Note that in pure Python, one ``dict`` probe per character is the cheapest possible step: "flat"
+    array-based representations (DAWG-alike) need several indexing operations and a binary search
+    per character instead, and are only faster when implemented in C.
     """
     def __init__(self, data=None):
         self.root = Leaf()
@@ -35,26 +44,44 @@ class Trie:
                 self.set(key, val)
 
     def put(self, path, payload):
-        cur = self.root
-        for p in path:
-            cur = cur.children[p]
-
-        cur.payloads.append(payload)
+        leaf = self.leaf(path)
+        if leaf.payloads is NO_PAYLOADS:
+            leaf.payloads = []
+        leaf.payloads.append(payload)
 
     def set(self, path, payloads):
+        self.leaf(path).payloads = payloads
+
+    def leaf(self, path):
         cur = self.root
         for p in path:
-            cur = cur.children[p]
+            if cur.children is None:
+                cur.children = {}
+            child = cur.children.get(p)
+            if child is None:
+                child = cur.children[p] = Leaf()
+            cur = child
 
-        cur.payloads = payloads
+        return cur
 
     def lookup(self, path):
-        for _, leaf in self.traverse(self.root, path):
-            yield from leaf.payloads
-
-    def traverse(self, cur, path, traversed=[]):
-        yield (traversed, cur)
-        if not path or path[0] not in cur.children:
-            return
+        # Plain loop instead of recursive traverse(): no generator per step, and no copying of the path
+        cur = self.root
+        yield from cur.payloads
+        for p in path:
+            if cur.children is None:
+                return
+            cur = cur.children.get(p)
+            if cur is None:
+                return
+            yield from cur.payloads
 
-        yield from self.traverse(cur.children[path[0]], path[1:], [*traversed, path[0]])
+    def traverse(self, cur, path):
+        yield ([], cur)
+        for i, p in enumerate(path):
+            if cur.children is None:
+                return
+            cur = cur.children.get(p)
+            if cur is None:
+                return
+            yield ([*path[:i+1]], cur)
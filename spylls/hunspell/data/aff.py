@@ -69,6 +69,7 @@ This classes are wrapping several types of somewhat pattern-alike objects that c
 """
 
 import re
+import sys
 import functools
 import itertools
 from operator import itemgetter
@@ -76,12 +77,55 @@ from operator import itemgetter
 from collections import defaultdict
 
 from dataclasses import dataclass, field
-from typing import List, Set, Dict, Tuple, Optional
+from typing import List, Set, Dict, Tuple, Optional, Pattern, Callable, Iterator
 
 from spylls.hunspell.algo.capitalization import Casing, GermanCasing, TurkicCasing
 from spylls.hunspell.algo.trie import Trie
 
 
+@functools.lru_cache(maxsize=None)
+def compile_regexp(pattern: str) -> Pattern:
+    """
+    ``re.compile`` with unlimited cache: lots of affixes share the same conditions (``.``, ``[^ey]``,
+    ...) and texts, and for big .aff files there are much more of them than fits into ``re``-s own
+    cache.
+    """
+    return re.compile(pattern)
+
+
+# Languages with Turkic casing rules (dotted and dotless "i")
+TURKIC_LANGUAGES = frozenset(['tr', 'tr_TR', 'az', 'crh'])
+
+
+def is_plain_text(pattern: str) -> bool:
+    """
+    Whether the (non-empty) pattern has no regexp special chars, and therefore can be searched as
+    a plain text.
+    """
+    return bool(pattern) and not any(c in pattern for c in '.^$*+?{}[]\\|()')
+
+
+def condition_width(condition: str) -> Optional[int]:
+    """
+    Number of chars matched by affix condition (like ``[^aeiou]y``), or ``None`` if it is not
+    a simple sequence of chars, dots and char classes.
+    """
+    width = 0
+    pos = 0
+    while pos < len(condition):
+        if condition[pos] == '[':
+            end = condition.find(']', pos + 1)
+            if end == -1 or condition[pos+1:end] in ('', '^') or any(c in condition[pos+1:end] for c in '[\\'):
+                return None
+            pos = end + 1
+        elif condition[pos] in '()*+?{}|\\^$]':
+            return None
+        else:
+            pos += 1
+        width += 1
+    return width
+
+
 @dataclass
 class BreakPattern:
     """
@@ -107,21 +151,61 @@ class BreakPattern:
         # special chars like #, -, * etc should be escaped, but ^ and $ should be treated as in regexps
         pattern = re.escape(self.pattern).replace('\\^', '^').replace('\\$', '$')
         if pattern.startswith('^') or pattern.endswith('$'):
-            self.regexp = re.compile(f"({pattern})")
+            self.regexp = compile_regexp(f"({pattern})")
         else:
-            self.regexp = re.compile(f".({pattern}).")
+            self.regexp = compile_regexp(f".({pattern}).")
+
+        # Patterns are typically just texts (like default "-", "^-", "-$"), optionally anchored at the
+        # beginning or end of the word: those are searched with string methods instead of regexp.
+        self.at_start = self.pattern.startswith('^')
+        self.at_end = self.pattern.endswith('$')
+        text = self.pattern[int(self.at_start):len(self.pattern) - int(self.at_end)]
+        self.text = text if text and '^' not in text and '$' not in text else None
+
+    def spans(self, word: str) -> Iterator[Tuple[int, int]]:
+        """
+        Yields ``(start, end)`` of all places where the pattern breaks the word, same as group 1 of
+        ``regexp.finditer`` would.
+        """
+        text = self.text
+        if text is None:
+            for match in self.regexp.finditer(word):
+                yield match.span(1)
+        elif self.at_start:
+            if word.startswith(text) and (not self.at_end or len(word) == len(text)):
+                yield (0, len(text))
+        elif self.at_end:
+            if word.endswith(text):
+                yield (len(word) - len(text), len(word))
+        else:
+            # Not anchored pattern should have at least one char before and after it; the char after
+            # is consumed by the match (so "a-b-c" is broken only at the first "-")
+            pos = word.find(text, 1)
+            while pos != -1 and pos + len(text) < len(word):
+                yield (pos, pos + len(text))
+                pos = word.find(text, pos + len(text) + 2)
 
 
 @dataclass
 class Ignore:
     """
     Contents of the :attr:`Aff.IGNORE` directive, chars to ignore on lookup/suggest, compiled with
-    ``str.maketrans``.
+    ``str.maketrans``. Applied to the text with :meth:`apply`.
     """
     chars: str
 
     def __post_init__(self):
         self.tr = str.maketrans('', '', self.chars)
+        self.charset = frozenset(self.chars)
+
+    def apply(self, text: str) -> str:
+        """
+        Removes ignored chars from text. Most of the texts don't have any, and checking for it is much
+        cheaper than ``str.translate`` (which looks up every char of the text in the table).
+        """
+        if self.charset.isdisjoint(text):
+            return text
+        return text.translate(self.tr)
 
 
 @dataclass
@@ -154,7 +238,37 @@ class RepPattern:
     replacement: str
 
     def __post_init__(self):
-        self.regexp = re.compile(self.pattern)
+        self.regexp = compile_regexp(self.pattern)
+        #: Replacement as it is applied (with ``_`` replaced by space)
+        self.substitution = self.replacement.replace('_', ' ')
+
+        # Most of the patterns are just texts, optionally anchored at the beginning or end of the word:
+        # those are searched with string methods, which is much cheaper than regexps
+        self.at_start = self.pattern.startswith('^')
+        self.at_end = self.pattern.endswith('$') and not self.pattern.endswith('\\$')
+        text = self.pattern[int(self.at_start):len(self.pattern) - int(self.at_end)]
+        self.text = text if is_plain_text(text) else None
+
+    def spans(self, word: str) -> Iterator[Tuple[int, int]]:
+        """
+        Yields ``(start, end)`` of all (non-overlapping) occurrences of the pattern in the word, same
+        as ``regexp.finditer`` would.
+        """
+        text = self.text
+        if text is None:
+            for match in self.regexp.finditer(word):
+                yield match.span()
+        elif self.at_start:
+            if word.startswith(text) and (not self.at_end or len(word) == len(text)):
+                yield (0, len(text))
+        elif self.at_end:
+            if word.endswith(text):
+                yield (len(word) - len(text), len(word))
+        else:
+            pos = word.find(text)
+            while pos != -1:
+                yield (pos, pos + len(text))
+                pos = word.find(text, pos + len(text))
 
 
 @dataclass
@@ -224,6 +338,12 @@ class Affix:
     #: Flags this affix has
     flags: Set[str] = field(default_factory=set)
 
+    def __post_init__(self):
+        # Flags are only checked (frequently) and never changed after reading. Long/numeric flags
+        # are interned, so the same flags of different affixes are the same string objects.
+        self.flag = sys.intern(self.flag)
+        self.flags = frozenset(sys.intern(flag) for flag in self.flags)
+
 
 @dataclass
 class Prefix(Affix):
@@ -232,9 +352,31 @@ class Prefix(Affix):
     """
 
     def __post_init__(self):
+        super().__post_init__()
         # "-" does NOT have a special regex-meaning, while might happen as a regular word char (for ex., hu_HU)
-        self.cond_regexp = re.compile('^' + self.condition.replace('-', '\\-'))
-        self.replace_regexp = re.compile('^' + self.add)
+        self.cond_regexp = compile_regexp('^' + self.condition.replace('-', '\\-'))
+        self._replace_regexp = None
+        # Conditions which are just texts are checked without regexp, and the most common "any char"
+        # condition just requires the stem to be non-empty
+        self.cond_text = self.condition if is_plain_text(self.condition) else None
+        self.cond_any = self.condition == '.'
+
+    def condition_matches(self, stem: str) -> bool:
+        """
+        Whether the stem satisfies :attr:`condition <Affix.condition>` (same as ``cond_regexp.search(stem)``).
+        """
+        if self.cond_any:
+            return stem != ''
+        if self.cond_text is not None:
+            return stem.startswith(self.cond_text)
+        return self.cond_regexp.match(stem) is not None
+
+    @property
+    def replace_regexp(self):
+        # Only needed when the prefix is actually found in some word, so compiled on first use
+        if self._replace_regexp is None:
+            self._replace_regexp = compile_regexp('^' + self.add)
+        return self._replace_regexp
 
     def __repr__(self):
         return (
@@ -251,9 +393,39 @@ class Suffix(Affix):
     """
 
     def __post_init__(self):
+        super().__post_init__()
         # "-" does NOT have a special regex-meaning, while might happen as a regular word char (for ex., hu_HU)
-        self.cond_regexp = re.compile(self.condition.replace('-', '\\-') + '$')
-        self.replace_regexp = re.compile(self.add + '$')
+        self.cond_regexp = compile_regexp(self.condition.replace('-', '\\-') + '$')
+        self._replace_regexp = None
+        # Suffixes are indexed (and looked up) from the end of the word
+        self.add_reversed = self.add[::-1]
+        # Conditions which are just texts are checked without regexp; others typically match fixed
+        # number of chars, so the regexp is matched only against the end of the stem, instead of
+        # searching through all of it. The most common "any char" condition just requires the stem
+        # to be non-empty.
+        self.cond_text = self.condition if is_plain_text(self.condition) else None
+        self.cond_width = condition_width(self.condition)
+        self.cond_any = self.condition == '.'
+
+    def condition_matches(self, stem: str) -> bool:
+        """
+        Whether the stem satisfies :attr:`condition <Affix.condition>` (same as ``cond_regexp.search(stem)``).
+        """
+        if self.cond_any:
+            return stem != ''
+        if self.cond_text is not None:
+            return stem.endswith(self.cond_text)
+        if self.cond_width is None:
+            return self.cond_regexp.search(stem) is not None
+        return len(stem) >= self.cond_width and \
+            self.cond_regexp.match(stem, len(stem) - self.cond_width) is not None
+
+    @property
+    def replace_regexp(self):
+        # Only needed when the suffix is actually found in some word, so compiled on first use
+        if self._replace_regexp is None:
+            self._replace_regexp = compile_regexp(self.add + '$')
+        return self._replace_regexp
 
     def __repr__(self):
         return (
@@ -305,37 +477,69 @@ class CompoundRule:
 
     text: str
 
+    # Patterns for parsing the rule text: (flag) and (flag)* for long/numeric flags, f and f* for short ones
+    LONG_FLAG = re.compile(r'\((.+?)\)')
+    LONG_PART_QUANTIFIED = re.compile(r'\(([^*?]+?)\)([*?]?)')
+    SHORT_PART_QUANTIFIED = re.compile(r'([^*?])([*?]?)')
+    QUANTIFIER = re.compile(r'[\*\?]')
+
     def __post_init__(self):
         # TODO: proper flag parsing! Long is (aa)(bb)*(cc), numeric is (1001)(1002)*(1003)
         # This works but is super ad-hoc!
         if '(' in self.text:
-            self.flags = set(re.findall(r'\((.+?)\)', self.text))
-            parts = re.findall(r'\([^*?]+?\)[*?]?', self.text)
+            self.flags = frozenset(self.LONG_FLAG.findall(self.text))
         else:
-            self.flags = set(re.sub(r'[\*\?]', '', self.text))
-            # There are ) flags used in real-life sv_* dictionaries
-            # Obviously it is quite ad-hoc (other chars that have special meaning in regexp might be
-            # used eventually)
-            parts = [part.replace(')', '\\)') for part in re.findall(r'[^*?][*?]?', self.text)]
-
-        self.re = re.compile(''.join(parts))
-        self.partial_re = re.compile(
-            functools.reduce(lambda res, part: f"{part}({res})?", parts[::-1])
-        )
+            self.flags = frozenset(self.QUANTIFIER.sub('', self.text))
+
+        # Instead of trying regexps against all combinations of flags of the words (which might be
+        # a lot for compounds of several parts), the rule is matched as an automaton: state N means
+        # "first N parts of the rule are matched", and each next word moves to the next state(s)
+        # if it has the part's flag. Optional parts ("?", "*") might be skipped without consuming words,
+        # so each transition leads to the set of states: the target one and all reachable by skipping.
+        # Every char of the rule besides "*" and "?" is a flag, even if it is special in regexps (like
+        # "." in "NN*.NN*%?", or ")" used in real-life sv_* dictionaries).
+        if '(' in self.text:
+            self.parts = self.LONG_PART_QUANTIFIED.findall(self.text)
+        else:
+            self.parts = self.SHORT_PART_QUANTIFIED.findall(self.text)
+
+        def skipping(state):
+            states = {state}
+            while state < len(self.parts) and self.parts[state][1]:
+                state += 1
+                states.add(state)
+            return frozenset(states)
+
+        self.initial_states = skipping(0)
+        self.transitions = [
+            (flag, skipping(state if quantifier == '*' else state + 1))
+            for state, (flag, quantifier) in enumerate(self.parts)
+        ]
 
     def fullmatch(self, flag_sets):
-        relevant_flags = [self.flags.intersection(f) for f in flag_sets]
-        return any(
-            self.re.fullmatch(''.join(fc))
-            for fc in itertools.product(*relevant_flags)
-        )
+        return len(self.parts) in self.match_states(flag_sets)
 
     def partial_match(self, flag_sets):
-        relevant_flags = [self.flags.intersection(f) for f in flag_sets]
-        return any(
-            self.partial_re.fullmatch(''.join(fc))
-            for fc in itertools.product(*relevant_flags)
-        )
+        return bool(self.match_states(flag_sets))
+
+    def match_states(self, flag_sets):
+        # Which states of the rule's automaton (see __post_init__) are reached after the words with
+        # flag_sets; empty if the words don't match the rule
+        final = len(self.parts)
+        states = self.initial_states
+        for flags in flag_sets:
+            reached = set()
+            for state in states:
+                if state != final:
+                    flag, targets = self.transitions[state]
+                    if flag in flags:
+                        reached.update(targets)
+            if not reached:
+                break
+            states = reached
+        else:
+            return states
+        return frozenset()
 
 
 @dataclass
@@ -384,9 +588,15 @@ class CompoundPattern:
         else:
             self.right_no_affix = False
 
+        # Most of the patterns specify only endchars/beginchars
+        self.stems_only = not (self.left_no_affix or self.right_no_affix or self.left_flag or self.right_flag)
+
     def match(self, left, right):
-        return (left.stem.endswith(self.left_stem)) and (right.stem.startswith(self.right_stem)) and \
-               (not self.left_no_affix or not left.is_base()) and \
+        if not (left.stem.endswith(self.left_stem) and right.stem.startswith(self.right_stem)):
+            return False
+        if self.stems_only:
+            return True
+        return (not self.left_no_affix or not left.is_base()) and \
                (not self.right_no_affix or not right.is_base()) and \
                (not self.left_flag or self.left_flag in left.flags()) and \
                (not self.right_flag or self.right_flag in right.flags())
@@ -431,31 +641,48 @@ class ConvTable:
             if pat1.endswith('_'):
                 pat1re = pat1re + '$'
 
-            return (pat1clean, re.compile(pat1re), pat2.replace('_', ' '))
+            return (pat1clean, compile_regexp(pat1re), pat2.replace('_', ' '))
 
         # TODO: don't need key=?.. (default behavior)
         self.table = sorted([compile_row(*row) for row in self.pairs], key=itemgetter(0))
+        # Same rows, longest patterns first (sorting is stable, so equally long ones are still in
+        # the order of the table): the first one matching at some position is the one to apply.
+        self.longest_first = sorted(self.table, key=lambda r: len(r[0]), reverse=True)
+
+        # Rows which patterns are plain text can only match at positions starting with the pattern's
+        # first char; other ones (empty, or using regexp syntax) are tried everywhere. Rows are grouped
+        # by the first char (keeping longest-first order), so only relevant rows are tried at each position.
+        # Rows in groups hold just what is needed when applying them: pattern's match method, length of
+        # the text it replaces, and the replacement.
+        def group(rows):
+            return tuple((pattern.match, len(search), replacement) for search, pattern, replacement in rows)
+
+        self.tried_everywhere = group(row for row in self.longest_first if not is_plain_text(row[0]))
+        self.by_first_char: Dict[str, Tuple[Tuple[Callable, int, str], ...]] = {}
+        for first in {row[0][0] for row in self.longest_first if is_plain_text(row[0])}:
+            self.by_first_char[first] = group(
+                row for row in self.longest_first if not is_plain_text(row[0]) or row[0][0] == first
+            )
+        self.first_chars = frozenset(self.by_first_char)
 
     def __call__(self, word):
+        # Most of the words have nothing to convert (and many tables are tiny)
+        if not self.tried_everywhere and self.first_chars.isdisjoint(word):
+            return word
+
         pos = 0
-        res = ''
+        res = []
         while pos < len(word):
-            matches = sorted(
-                [(search, pattern, replacement)
-                 for search, pattern, replacement in self.table
-                 if pattern.match(word, pos)],
-                key=lambda r: len(r[0]),
-                reverse=True
-            )
-            if matches:
-                search, pattern, replacement = matches[0]
-                res += replacement
-                pos += len(search)
+            for match, length, replacement in self.by_first_char.get(word[pos], self.tried_everywhere):
+                if match(word, pos):
+                    res.append(replacement)
+                    pos += length
+                    break
             else:
-                res += word[pos]
+                res.append(word[pos])
                 pos += 1
 
-        return res
+        return ''.join(res)
 
 
 @dataclass
@@ -491,6 +718,8 @@ class PhonetTable:
 
         followup: bool = True
 
+        # Not used by metaphone itself (it finds rules with PhonetTable.match_at, one regexp for all
+        # rules of the letter), kept for checking the single rule
         def match(self, word, pos):
             if self.start and pos > 0:
                 return False
@@ -499,10 +728,45 @@ class PhonetTable:
             return self.search.match(word, pos)
 
     def __post_init__(self):
-        self.rules = defaultdict(list)
+        rules = defaultdict(list)
 
         for search, replacement in self.table:
-            self.rules[search[0]].append(self.parse_rule(search, replacement))
+            rules[search[0]].append(self.parse_rule(search, replacement))
+
+        # Rules by the first letter. Plain dict: looking up chars without rules shouldn't add empty
+        # lists to it
+        self.rules: Dict[str, Tuple[PhonetTable.Rule, ...]] = {
+            char: tuple(char_rules) for char, char_rules in rules.items()
+        }
+
+        # All rules for the same first letter are joined into one regexp of alternatives (tried in order,
+        # like rules are), so finding the applicable rule is one regexp match instead of one per rule.
+        # Named group of the alternative tells which rule it is.
+        def alternative(index, rule):
+            pattern = rule.search.pattern
+            if rule.start:
+                pattern = '^' + pattern
+            if rule.end:
+                pattern += '\\Z'
+            return f'(?P<r{index}>{pattern})'
+
+        self.matchers: Dict[str, Callable] = {
+            char: compile_regexp('|'.join(alternative(i, rule) for i, rule in enumerate(char_rules))).match
+            for char, char_rules in self.rules.items()
+        }
+
+    def match_at(self, word: str, pos: int) -> Optional[Tuple[Rule, int]]:
+        """
+        Finds the first rule matching at the position in the word, returns the rule and the position
+        after the text it matched.
+        """
+        matcher = self.matchers.get(word[pos])
+        if matcher is None:
+            return None
+        match = matcher(word, pos)
+        if match is None:
+            return None
+        return (self.rules[word[pos]][int(match.lastgroup[1:])], match.end())
 
     def parse_rule(self, search: str, replacement: str) -> Rule:
         m = self.RULE_PATTERN.fullmatch(search)
@@ -520,7 +784,7 @@ class PhonetTable:
             regex = ''.join(text)
 
         return PhonetTable.Rule(
-            search=re.compile(regex),
+            search=compile_regexp(regex),
             replacement=replacement,
             start=('^' in m.group('flags')),
             end=('$' in m.group('flags')),
@@ -1133,7 +1397,7 @@ class Aff:
     def __post_init__(self):
         suffixes = defaultdict(list)
         for suf in itertools.chain.from_iterable(self.SFX.values()):
-            suffixes[suf.add[::-1]].append(suf)
+            suffixes[suf.add_reversed].append(suf)
 
         self.suffixes_index = Trie(suffixes)
 
@@ -1145,7 +1409,7 @@ class Aff:
 
         if self.CHECKSHARPS:
             self.casing = GermanCasing()
-        elif self.LANG in ['tr', 'tr_TR', 'az', 'crh']:     # TODO: more robust language code check!
+        elif self.LANG in TURKIC_LANGUAGES:     # TODO: more robust language code check!
             self.casing = TurkicCasing()
         else:
             self.casing = Casing()
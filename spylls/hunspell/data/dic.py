@@ -33,14 +33,44 @@ list, and also provides some indexes and utilities for convenience.
 .. autoclass:: Word
 """
 
-from collections import defaultdict
+from collections import abc
 from dataclasses import dataclass
-from typing import List, Set, Dict
+from typing import List, FrozenSet, Dict, Mapping, Sequence
 
 from spylls.hunspell.algo.capitalization import Type as CapType
 
+# Returned for stems absent from the dictionary (instead of creating a new empty list each time)
+NO_WORDS = ()
 
-@dataclass
+
+class _NoData(abc.Mapping):
+    # Read-only empty mapping: unlike MappingProxyType({}), can be pickled (as a reference to NO_DATA)
+    __slots__ = ()
+
+    def __getitem__(self, tag):
+        raise KeyError(tag)
+
+    def __iter__(self):
+        return iter(())
+
+    def __len__(self):
+        return 0
+
+    def __repr__(self):
+        return 'NO_DATA'
+
+    def __reduce__(self):
+        return 'NO_DATA'
+
+
+# Data tags of the words without them (most of the words in most dictionaries), shared by all of them
+NO_DATA: Mapping[str, List[str]] = _NoData()
+
+# Alternative spellings of the words without them (again, most of the words)
+NO_ALT_SPELLINGS: Sequence[str] = ()
+
+
+@dataclass(eq=False)
 class Word:
     """
     One word (stem) of a .dic file.
@@ -99,20 +129,26 @@ class Word:
     .. autoattribute:: captype
     """
 
+    # There is one instance per dictionary entry (hundreds of thousands for big dictionaries): no
+    # per-instance __dict__. Words are compared (and hashed) by identity, not by all the fields:
+    # every entry is a separate object anyway, and it makes cheap comparison of (score, word) tuples
+    # with equal scores in ngram_suggest's heaps.
+    __slots__ = ('stem', 'flags', 'data', 'alt_spellings', 'captype')
+
     #: Word stem
     stem: str
     #: Flags of the word, parsed depending on aff-file settings. ``ABCD`` might be parsed
     #: into ``{"A", "B", "C", "D"}`` (default flag format, "short"), or ``{"AB", "CD"}``
     #: ("long" flag format)
-    flags: Set[str]
+    flags: FrozenSet[str]
     #: Raw values of data tags. Each tag can be repeated several times, like ``witch ph:wich ph:which``,
-    #: that's why dictionary values are lists
-    data: Dict[str, List[str]]
+    #: that's why dictionary values are lists. Words without tags share one read-only empty mapping
+    data: Mapping[str, List[str]]
 
     #: List of alternative word spellings, defined with ``ph:`` data tag, and
     #: used by :mod:`ngram_suggest <spylls.hunspell.algo.ngram_suggest>`. Not everything specified
     #: with ``ph:`` is stored here, see explanations in class docs.
-    alt_spellings: List[str]
+    alt_spellings: Sequence[str]
     #: One of :class:`capitalization.Type <spylls.hunspell.algo.capitalization.Type>` (no capitalization,
     #: initial letter capitalized, all letters, or mixed) analyzed on dictionary reading, will be useful on lookup.
     captype: CapType
@@ -182,10 +218,10 @@ class Dic:
     words: List[Word]
 
     def __post_init__(self):
-        self.index = defaultdict(list)
-        self.lowercase_index = defaultdict(list)
+        self.index: Dict[str, List[Word]] = {}
+        self.lowercase_index: Dict[str, List[Word]] = {}
 
-    def homonyms(self, stem: str, *, ignorecase: bool = False) -> List[Word]:
+    def homonyms(self, stem: str, *, ignorecase: bool = False) -> Sequence[Word]:
         """
         Returns all :class:`Word` instances with the same stem.
 
@@ -197,8 +233,8 @@ class Dic:
                         by "MCDONALDS")
         """
         if ignorecase:
-            return self.lowercase_index.get(stem, [])
-        return self.index.get(stem, [])
+            return self.lowercase_index.get(stem, NO_WORDS)
+        return self.index.get(stem, NO_WORDS)
 
     def has_flag(self, stem: str, flag: str, *, for_all: bool = False) -> bool:
         """
@@ -212,12 +248,19 @@ class Dic:
             for_all: If ``True``, checks if **all** homonyms have this flag, if ``False``, checks if
                      at least one.
         """
-        homonyms = self.homonyms(stem)
+        homonyms = self.index.get(stem)
         if not homonyms:
             return False
+        # Almost all stems have just one entry: no need to iterate (and create generator for any/all)
+        if len(homonyms) == 1:
+            return flag in homonyms[0].flags
         if for_all:
             return all(flag in homonym.flags for homonym in homonyms)
-        return any(flag in homonym.flags for homonym in homonyms)
+        # Plain loop is cheaper than any() with generator for a couple of homonyms
+        for homonym in homonyms:
+            if flag in homonym.flags:
+                return True
+        return False
 
     def append(self, word: Word, *, lower: List[str]):
         """
@@ -232,9 +275,9 @@ class Dic:
                    :meth:`Casing.lower <spylls.hunspell.algo.capitalization.Casing.lower>` for details.
         """
         self.words.append(word)
-        self.index[word.stem].append(word)
+        self.index.setdefault(word.stem, []).append(word)
         for lword in lower:
-            self.lowercase_index[lword].append(word)
+            self.lowercase_index.setdefault(lword, []).append(word)
 
     def __repr__(self):
         return f'Dictionary(... {len(self.words)} words ...)'
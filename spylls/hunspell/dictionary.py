@@ -1,15 +1,24 @@
 from __future__ import annotations
 
-import glob
+import contextlib
+import gc
+import pickle
+import tempfile
 import zipfile
 import os
 
-from typing import Iterator
+from typing import Iterator, Tuple
 
+from spylls import __version__
 from spylls.hunspell import data, readers
 from spylls.hunspell.readers.file_reader import FileReader, ZipReader
 from spylls.hunspell.algo import lookup, suggest
 
+# Version of the dictionary cache format (see Dictionary.from_files), should be increased on each
+# change of data classes or of what is read into them. (Caches are also never shared between
+# different Spylls versions.)
+CACHE_VERSION = 6
+
 
 class Dictionary:
     """
@@ -121,7 +130,7 @@ class Dictionary:
     }
 
     @classmethod
-    def from_files(cls, path: str) -> Dictionary:
+    def from_files(cls, path: str, *, cache: bool = False) -> Dictionary:
         """
         Read dictionary from pair of files ``/some/path/some_name.aff`` and ``/some/path/some_name.dic``.
 
@@ -131,15 +140,57 @@ class Dictionary:
             from spylls.hunspell import Dictionary
             en = Dictionary.from_files('en_US')
 
+        Reading big dictionaries takes seconds, so the read data can be cached::
+
+            en = Dictionary.from_files('en_US', cache=True)
+
+        On the first call, this reads the files as usual and stores the result (pickled) in
+        ``/some/path/some_name.spylls-cache``; next calls load it from there (which is several times
+        faster), unless ``.aff`` or ``.dic`` were changed since. If the cache file can't be written (for
+        example, the dictionary is in read-only folder), dictionary is just read from files each time.
+
+        .. warning::
+
+            Loading a pickle can execute arbitrary code, so the cache should be used only with
+            dictionaries from a trusted folder, which nobody else can write to: whoever can replace
+            ``some_name.spylls-cache`` there can run their code on the next ``from_files`` call.
+
         Args:
             path: Should be just ``/some/path/some_name``.
+            cache: Whether to use the cache file.
         """
 
         if path in cls.DISTRIBUTED and not os.path.exists(path + '.aff'):
             path = os.path.join(os.path.dirname(os.path.realpath(__file__)), 'data', cls.DISTRIBUTED[path], path)
 
-        aff, context = readers.read_aff(FileReader(path + '.aff'))
-        dic = readers.read_dic(FileReader(path + '.dic', encoding=context.encoding), aff=aff, context=context)
+        if not cache:
+            return cls(*read_files(path))
+
+        cache_path = path + '.spylls-cache'
+        # Cache is valid for the same format and the same files (judging by modification time and size)
+        stats = [os.stat(path + '.aff'), os.stat(path + '.dic')]
+        key = (__version__, CACHE_VERSION, *((stat.st_mtime_ns, stat.st_size) for stat in stats))
+
+        try:
+            with open(cache_path, 'rb') as file:
+                if pickle.load(file) == key:
+                    # Unpickling creates hundreds of thousands of objects, and none of them are garbage:
+                    # running garbage collector on them meanwhile makes loading twice as slow.
+                    gc_enabled = gc.isenabled()
+                    gc.disable()
+                    try:
+                        aff, dic = pickle.load(file)
+                    finally:
+                        if gc_enabled:
+                            gc.enable()
+                    return cls(aff, dic)
+        except Exception:  # pylint: disable=broad-except
+            # Broken or incompatible cache file fails unpickling in a lot of ways, but it is just an
+            # optimization: read the files and rewrite it then
+            pass
+
+        aff, dic = read_files(path)
+        write_cache(cache_path, key, (aff, dic))
 
         return cls(aff, dic)
 
@@ -155,12 +206,14 @@ class Dictionary:
             path: Path to zip-file/extension.
         """
 
-        file = zipfile.ZipFile(path)
-        # TODO: fail if there are several
-        aff_path = [name for name in file.namelist() if name.endswith('.aff')][0]
-        dic_path = [name for name in file.namelist() if name.endswith('.dic')][0]
-        aff, context = readers.read_aff(ZipReader(file.open(aff_path)))
-        dic = readers.read_dic(ZipReader(file.open(dic_path), encoding=context.encoding), aff=aff, context=context)
+        with zipfile.ZipFile(path) as file:
+            names = file.namelist()
+            # TODO: fail if there are several
+            aff_path = [name for name in names if name.endswith('.aff')][0]
+            dic_path = [name for name in names if name.endswith('.dic')][0]
+            aff, context = readers.read_aff(ZipReader(file.open(aff_path)))
+            dic = readers.read_dic(ZipReader(file.open(dic_path), encoding=context.encoding),
+                                   aff=aff, context=context)
 
         return cls(aff, dic)
 
@@ -175,9 +228,9 @@ class Dictionary:
         """
 
         for folder in cls.PATHES:
-            pathes = glob.glob(f'{folder}/{name}.aff')
-            if pathes:
-                return cls.from_files(pathes[0].replace('.aff', ''))
+            path = os.path.join(folder, name)
+            if os.path.isfile(f'{path}.aff'):
+                return cls.from_files(path)
 
         raise LookupError(f'{name}.aff not found (search pathes are {cls.PATHES!r})')
 
@@ -225,3 +278,36 @@ class Dictionary:
         """
 
         yield from self.suggester(word)
+
+
+def read_files(path: str) -> Tuple[data.aff.Aff, data.dic.Dic]:
+    """
+    Reads ``path.aff`` and ``path.dic`` (used by :meth:`Dictionary.from_files`).
+    """
+    aff, context = readers.read_aff(FileReader(path + '.aff'))
+    dic = readers.read_dic(FileReader(path + '.dic', encoding=context.encoding), aff=aff, context=context)
+    return (aff, dic)
+
+
+def write_cache(path: str, key: tuple, content: Tuple[data.aff.Aff, data.dic.Dic]):
+    """
+    Writes cache file for :meth:`Dictionary.from_files`. The content is written to a temporary file
+    first, and replaces the old cache only when fully written, so a failed write never leaves a broken
+    cache. If the cache can't be written for whatever reason, it is just not written.
+    """
+    try:
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path) or '.',
+                                        prefix=os.path.basename(path), suffix='.tmp')
+    except OSError:
+        return
+
+    try:
+        with os.fdopen(fd, 'wb') as file:
+            pickle.dump(key, file)
+            pickle.dump(content, file, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+    except Exception:  # pylint: disable=broad-except
+        # Not only OSError: something in the (possibly user-changed) data might be not picklable, and
+        # the cache is just an optimization
+        with contextlib.suppress(OSError):
+            os.remove(tmp_path)
@@ -150,7 +150,7 @@ def read_directive(source: BaseReader, line: str, *, context: Context) -> Option
         context: current reading context
     """
 
-    name, *arguments = re.split(r'\s+', line)
+    name, *arguments = line.split()
 
     # Simplify a bit: no need to try reading value if the start doesn't even look like a directive...
     if not re.match(r'^[A-Z]+$', name):
@@ -204,7 +204,7 @@ def read_value(source: BaseReader, directive: str, *values, context: Context) ->
         # TODO: handle if fetching it we'll find something NOT starting with teh expected directive name
         # TODO: \s+ => only space and tab, no unicode whitespaces
         return [
-            re.split(r'\s+', ln)[1:]
+            ln.split()[1:]
             for num, ln in itertools.islice(source, count)
         ]
 
@@ -288,7 +288,7 @@ def make_affix(kind, flag, crossproduct, _, strip, add, *rest, context):
     cond = rest[0] if rest else ''
     add, _, flags = add.partition('/')
     if context.ignore:
-        add = add.translate(context.ignore.tr)
+        add = context.ignore.apply(add)
 
     # TODO: Data fields (including AM)
     return kind_class(
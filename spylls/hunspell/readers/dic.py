@@ -1,7 +1,9 @@
 from collections import defaultdict
+from collections.abc import Mapping
 import re
+import sys
 
-from typing import List, Dict, Set, Optional
+from typing import List, Dict, Set, FrozenSet, Optional, Iterator, Sequence
 
 from spylls.hunspell.data import dic
 from spylls.hunspell.data.aff import Aff, RepPattern
@@ -13,7 +15,6 @@ from spylls.hunspell.algo.capitalization import Type as CapType
 
 
 COUNT_REGEXP = re.compile(r'^\d+(\s+|$)')   # should start with digits, but can have whatever further
-SPACES_REGEXP = re.compile(r"\s+")
 SLASH_REGEXP = re.compile(r'(?<!\\)/')
 TAG_REGEXP = re.compile(r'[ \t]\w{2}:')
 
@@ -32,6 +33,15 @@ def read_dic(source: BaseReader, *, aff: Aff, context: Context) -> dic.Dic:
     """
     result = dic.Dic(words=[])
 
+    # There are typically just hundreds of different flag sets for hundreds of thousands of words, so
+    # they are parsed once, and all the words with same flags share the same (immutable) set. Flags
+    # are interned, like affixes' ones, so the same flags are the same string objects.
+    flag_sets: Dict[str, FrozenSet[str]] = {}
+
+    # Data tags are parsed at once only if they can contain ``ph:`` (which affects reading); others
+    # are parsed only when (and if) somebody looks at them.
+    aliases_have_ph = any('ph:' in tag for tags in aff.AM.values() for tag in tags)
+
     for num, line in source:
         if num == 1 and COUNT_REGEXP.match(line):
             continue
@@ -41,7 +51,8 @@ def read_dic(source: BaseReader, *, aff: Aff, context: Context) -> dic.Dic:
         # * either space character, followed by text in format "xy:something" (exactly two-letter tag, colon, data)
         # * or _tab_ (and exactly tab) character, and then some data
 
-        tags_match = TAG_REGEXP.search(line)
+        # (Most of the lines have neither, so regexp search is done only if there is a colon at all)
+        tags_match = TAG_REGEXP.search(line) if ':' in line else None
         tags_start: Optional[int] = None
         if tags_match:
             tags_start = tags_match.start()
@@ -52,44 +63,53 @@ def read_dic(source: BaseReader, *, aff: Aff, context: Context) -> dic.Dic:
 
         if tags_start:
             word = line[:tags_start]
-            # If tags were present, parse them
-            data = parse_data(line[tags_start:], aff.AM)
+            # If tags were present, parse them (or prepare to)
+            tags_text = line[tags_start:]
+            if aliases_have_ph or 'ph:' in tags_text:
+                data = parse_data(tags_text, aff.AM)
+                ph_patterns = data.get('ph', [])
+            else:
+                data = LazyData(tags_text, aff.AM)
+                ph_patterns = []
         else:
             word = line
-            data = {}
+            data = dic.NO_DATA
+            ph_patterns = []
 
         # Now, the "word" part is "stem/flags". Flags are optional, and to complicate matters further:
         #
         # * if the word STARTS with "/" -- it is not empty stem + flags, but "word starting with /";
         # * if the "/" should be in stem, it can be screened by "\/"
-        if word.startswith('/'):
-            flags = ''
-        else:
-            word_with_flags = SLASH_REGEXP.split(word, 2)
-            if len(word_with_flags) == 2:
-                word, flags = word_with_flags
-            else:
-                flags = ''
+        #
+        # Most of the words have neither flags nor slashes, and are left as is.
+        flags = ''
+        if '/' in word:
+            if not word.startswith('/'):
+                word_with_flags = SLASH_REGEXP.split(word, 2)
+                if len(word_with_flags) == 2:
+                    word, flags = word_with_flags
 
-        if r'\/' in word:
-            word = word.replace(r'\/', '/')
+            if r'\/' in word:
+                word = word.replace(r'\/', '/')
 
         # Here we have our clean word (with screened "\/" replaced, and flag splitted off)
 
         if context.ignore:
             # ...now we remove any chars context says to ignore...
-            word = word.translate(context.ignore.tr)
+            word = context.ignore.apply(word)
 
         # And cache word's casing and its lowerase form
         captype = aff.casing.guess(word)
-        lower = aff.casing.lower(word) if captype != CapType.NO else word
+        # (Words without capitals need no lowercase index entries: they are already in the main index)
+        lower = aff.casing.lower(word) if captype != CapType.NO else []
 
-        alt_spellings = []
+        alt_spellings: Sequence[str] = dic.NO_ALT_SPELLINGS
 
-        if 'ph' in data:
+        if ph_patterns:
             # Now, for all "ph:" (alt.spellings) patterns:
+            spellings: List[str] = []
 
-            for pattern in data['ph']:
+            for pattern in ph_patterns:
                 # TODO: https://manpages.debian.org/experimental/libhunspell-dev/hunspell.5.en.html#Optional_data_fields
                 # according to it, Wednesday ph:wendsay should produce two cases
                 #   REP wendsay Wednesday
@@ -109,12 +129,19 @@ def read_dic(source: BaseReader, *, aff: Aff, context: Context) -> dic.Dic:
                     # should be added to REP table
                     aff.REP.append(RepPattern(pattern, word))
                     # ...and that "wensday" should be stored in word as alt.spelling (used for ngram suggest)
-                    alt_spellings.append(pattern)
+                    spellings.append(pattern)
+
+            if spellings:
+                alt_spellings = spellings
+
+        word_flags = flag_sets.get(flags)
+        if word_flags is None:
+            word_flags = flag_sets[flags] = frozenset(sys.intern(flag) for flag in context.parse_flags(flags))
 
         # And here we are!
         word_obj = dic.Word(
             stem=word,
-            flags={*context.parse_flags(flags)},
+            flags=word_flags,
             data=data,
             captype=captype,
             alt_spellings=alt_spellings
@@ -124,6 +151,47 @@ def read_dic(source: BaseReader, *, aff: Aff, context: Context) -> dic.Dic:
     return result
 
 
+class LazyData(Mapping):
+    """
+    Data tags of the word, parsed with :meth:`parse_data` on first access. Most of the consumers
+    never look at any tags besides ``ph:`` (and those are parsed immediately on reading), so for
+    dictionaries with lots of morphological data, this saves a lot of work.
+    """
+
+    __slots__ = ('text', 'aliases', 'parsed')
+
+    def __init__(self, text: str, aliases: Dict[str, Set[str]]):
+        self.text = text
+        self.aliases = aliases
+        self.parsed: Optional[Dict[str, List[str]]] = None
+
+    def _data(self) -> Dict[str, List[str]]:
+        if self.parsed is None:
+            self.parsed = parse_data(self.text, self.aliases)
+        return self.parsed
+
+    # All the access is delegated to the parsed dictionary, so it behaves exactly like it (including
+    # defaultdict's lookup of absent tags).
+
+    def __getitem__(self, tag: str) -> List[str]:
+        return self._data()[tag]
+
+    def __contains__(self, tag) -> bool:
+        return tag in self._data()
+
+    def get(self, tag, default=None):
+        return self._data().get(tag, default)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._data())
+
+    def __len__(self) -> int:
+        return len(self._data())
+
+    def __repr__(self) -> str:
+        return repr(self._data())
+
+
 def parse_data(text: str, aliases: Dict[str, Set[str]]) -> Dict[str, List[str]]:
     """
     Parse data tags after stem.
@@ -148,7 +216,7 @@ def parse_data(text: str, aliases: Dict[str, Set[str]]) -> Dict[str, List[str]]:
     """
     data: Dict[str, List[str]] = defaultdict(list)
 
-    parts = SPACES_REGEXP.split(text)
+    parts = text.split()
     for tag_str in parts:
         if ':' in tag_str:
             # If it has "foo:bar" form, it is data tag
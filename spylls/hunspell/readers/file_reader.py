@@ -6,14 +6,11 @@
 .. autoclass:: ZipReader
 """
 
-import io
-import zipfile
-
 
 class BaseReader:
     """
     Common base for :class:`FileReader` and :class:`ZipReader`. In fact, it is a very thin wrapper
-    around ``IO``-alike object, to read it line by line and:
+    around the file's content (bytes), to read it line by line and:
 
     * strip lines transparently
     * ignore BOM (byte-order mark) at the beginning
@@ -26,13 +23,31 @@ class BaseReader:
             # ..continue to read from the same line
 
     """
-    def __init__(self, obj):
+
+    # line_no and iter are touched for every line read
+    __slots__ = ('content', 'lines', 'line_no', 'iter')
+
+    def __init__(self, content: bytes, encoding: str):
+        # UTF-8 BOM is dropped once from the raw content, so it doesn't matter which encoding the
+        # content is decoded with
+        if content.startswith(b'\xef\xbb\xbf'):
+            content = content[3:]
+        self.content = content
         self.line_no = 0
 
-        self.reset_io(obj)
+        self.reset_encoding(encoding)
+
+    def reset_encoding(self, encoding: str):
+        # The content is decoded and split into lines at once, which is much faster than reading it line
+        # by line; after the encoding change, reading continues from the same line number.
+        #
+        # errors='surrogateescape', because at least hu_HU dictionary of LibreOffice uses invalid
+        # in UTF-8 single-bytes as suffix flags
+        text = self.content.decode(encoding, errors='surrogateescape')
+        # Same newlines handling as files opened in text mode have
+        self.lines = text.replace('\r\n', '\n').replace('\r', '\n').split('\n')
 
-    def reset_encoding(self, encoding):
-        raise NotImplementedError
+        self.iter = self.readlines()
 
     def __iter__(self):
         return self
@@ -41,20 +56,11 @@ class BaseReader:
         return self.iter.__next__()
 
     def readlines(self):
-        ln = self.io.readline()
-        while ln != '':
-            self.line_no += 1
-            if self.line_no == 1 and ln.startswith("\xef\xbb\xbf"):
-                ln = ln.replace("\xef\xbb\xbf", '')
-            yield (self.line_no, ln.strip())
-            ln = self.io.readline()
-
-    def reset_io(self, obj):
-        self.io = obj
-        self.iter = filter(lambda l: l[1] != '', self.readlines())
-
-        for _ in range(self.line_no):
-            self.io.readline()
+        for num, ln in enumerate(self.lines[self.line_no:], start=self.line_no + 1):
+            ln = ln.strip()
+            if ln:
+                self.line_no = num
+                yield (num, ln)
 
 
 class FileReader(BaseReader):
@@ -62,17 +68,12 @@ class FileReader(BaseReader):
     Reader implementation for simple filesystem file.
     """
 
+    __slots__ = ('path',)
+
     def __init__(self, path, encoding='Windows-1252'):
         self.path = path
-        super().__init__(self._open(path, encoding))
-
-    def reset_encoding(self, encoding):
-        self.reset_io(self._open(self.path, encoding))
-
-    def _open(self, path, encoding):  # pylint: disable=no-self-use
-        # errors='surrogateescape', because at least hu_HU dictionary of LibreOffice uses invalid
-        # in UTF-8 single-bytes as suffix flags
-        return open(path, 'r', encoding=encoding, errors='surrogateescape')
+        with open(path, 'rb') as file:
+            super().__init__(file.read(), encoding)
 
 
 class ZipReader(BaseReader):
@@ -80,14 +81,8 @@ class ZipReader(BaseReader):
     Reader implementation for file inside zip archive.
     """
 
-    def __init__(self, zip_obj, encoding='Windows-1252'):
-        self.zipfile = (zip_obj._fileobj._file.name, zip_obj.name)
-        super().__init__(self._open(zip_obj, encoding))
-
-    def reset_encoding(self, encoding):
-        zipname, path = self.zipfile
-        # FIXME: Like, really?..
-        self.reset_io(self._open(zipfile.ZipFile(zipname).open(path), encoding))
+    __slots__ = ()
 
-    def _open(self, zip_obj, encoding):  # pylint: disable=no-self-use
-        return io.TextIOWrapper(zip_obj, encoding=encoding, errors='surrogateescape')
+    def __init__(self, zip_obj, encoding='Windows-1252'):
+        with zip_obj:
+            super().__init__(zip_obj.read(), encoding)
@@ -1,3 +1,4 @@
+import functools
 from pathlib import Path
 
 from spylls.hunspell import Dictionary
@@ -12,6 +13,7 @@ def read_list(name, ignoredot=True):
 
     return [ln.strip() for ln in path.open().read().splitlines() if not ignoredot or ln[-1:] != '.']
 
+@functools.lru_cache(maxsize=None)
 def read_dictionary(name):
     path = BASE_FOLDER / name
     return Dictionary.from_files(str(path))
@@ -21,11 +21,14 @@ def test(name):
         if words == ['Oh', 'my gosh!'] or words == ['OH', 'MY GOSH!']:
             sug[i] = [', '.join(words)]
 
+    # Some words are repeated in the lists: suggestions for each are calculated once
+    got = {word: list(dictionary.suggest(word)) for word in dict.fromkeys(bad)}
+
     return [
         {
             'word': word,
             'expected': sug[i] if i < len(sug) and sug[i][0] != '' else [],
-            'got': list(dictionary.suggest(word))
+            'got': got[word]
         } for i, word in enumerate(bad)
     ]
 
@@ -0,0 +1,29 @@
+from spylls.hunspell import Dictionary
+from spylls.hunspell.data.aff import CompoundRule
+
+
+def test_metacharacter_flags():
+    # Every char of the rule besides * and ? is a flag, even if it has a special meaning in regexps
+    rule = CompoundRule('A+B')
+    assert rule.fullmatch([{'A'}, {'+'}, {'B'}])
+    assert not rule.fullmatch([{'A'}, {'B'}])
+    assert not rule.fullmatch([{'A'}, {'A'}, {'B'}])
+
+    rule = CompoundRule('A.B')
+    assert rule.fullmatch([{'A'}, {'.'}, {'B'}])
+    assert not rule.fullmatch([{'A'}, {'C'}, {'B'}])
+
+    rule = CompoundRule('A)B')
+    assert rule.fullmatch([{'A'}, {')'}, {'B'}])
+
+
+def test_metacharacter_flags_in_dictionary():
+    # NN*.NN*%? -- "." is a flag of the "." word, not "any word"
+    dictionary = Dictionary.from_files('tests/integrational/fixtures/compoundrule5')
+
+    assert dictionary.lookup('1.5%')
+    assert not dictionary.lookup('1%0')
+    assert not dictionary.lookup('1%01')
+    assert not dictionary.lookup('0%1%')
+    assert not dictionary.lookup('1%0%')
+    assert list(dictionary.suggest('10%%')) == ['10%']
@@ -0,0 +1,146 @@
+import os
+import pickle
+import shutil
+
+import pytest
+
+from spylls.hunspell import Dictionary
+from spylls.hunspell import dictionary as dictionary_module
+
+FIXTURE = 'tests/integrational/fixtures/base'
+
+
+@pytest.fixture
+def path(tmp_path):
+    for ext in ('aff', 'dic'):
+        shutil.copy(f'{FIXTURE}.{ext}', tmp_path / f'base.{ext}')
+    return str(tmp_path / 'base')
+
+
+@pytest.fixture
+def reads(monkeypatch):
+    # Counts how many times dictionary was actually read from .aff/.dic (and not from the cache)
+    calls = []
+    original = dictionary_module.read_files
+
+    def read_files(path):
+        calls.append(path)
+        return original(path)
+
+    monkeypatch.setattr(dictionary_module, 'read_files', read_files)
+    return calls
+
+
+def cache_files(path):
+    folder, name = os.path.split(path)
+    return sorted(file for file in os.listdir(folder) if file.startswith(name + '.spylls-cache'))
+
+
+def test_round_trip(path, reads):
+    dictionary = Dictionary.from_files(path, cache=True)
+    assert len(reads) == 1
+    assert cache_files(path) == ['base.spylls-cache']
+
+    cached = Dictionary.from_files(path, cache=True)
+    assert len(reads) == 1
+
+    assert [word.stem for word in cached.dic.words] == [word.stem for word in dictionary.dic.words]
+    for word in ['created', 'uncreate', 'OpenOffice.org', 'looked', 'unlooked']:
+        assert cached.lookup(word) == dictionary.lookup(word)
+        assert list(cached.suggest(word)) == list(dictionary.suggest(word))
+
+
+def test_invalidated_by_mtime(path, reads):
+    Dictionary.from_files(path, cache=True)
+
+    stat = os.stat(path + '.aff')
+    os.utime(path + '.aff', ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    Dictionary.from_files(path, cache=True)
+    assert len(reads) == 2
+
+    Dictionary.from_files(path, cache=True)
+    assert len(reads) == 2
+
+
+def test_invalidated_by_size(path, reads):
+    dictionary = Dictionary.from_files(path, cache=True)
+    assert not dictionary.lookup('spylls')
+
+    # Same modification time, but different content
+    stat = os.stat(path + '.dic')
+    with open(path + '.dic', 'a') as file:
+        file.write('spylls\n')
+    os.utime(path + '.dic', ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+    dictionary = Dictionary.from_files(path, cache=True)
+    assert len(reads) == 2
+    assert dictionary.lookup('spylls')
+
+
+def test_cache_can_not_be_written(path, reads):
+    # Something that is not a file is in the cache's place
+    os.mkdir(path + '.spylls-cache')
+
+    assert Dictionary.from_files(path, cache=True).lookup('created')
+    assert Dictionary.from_files(path, cache=True).lookup('created')
+    assert len(reads) == 2
+    assert cache_files(path) == ['base.spylls-cache']
+    assert os.path.isdir(path + '.spylls-cache')
+
+
+@pytest.mark.skipif(hasattr(os, 'geteuid') and os.geteuid() == 0, reason='root can write anywhere')
+def test_read_only_folder(path, reads):
+    folder = os.path.dirname(path)
+    os.chmod(folder, 0o555)
+    try:
+        assert Dictionary.from_files(path, cache=True).lookup('created')
+        assert Dictionary.from_files(path, cache=True).lookup('created')
+        assert len(reads) == 2
+        assert cache_files(path) == []
+    finally:
+        os.chmod(folder, 0o755)
+
+
+def test_not_picklable(path, monkeypatch):
+    original = dictionary_module.read_files
+
+    def read_files(path):
+        aff, dic = original(path)
+        aff.custom = lambda word: word
+        return aff, dic
+
+    monkeypatch.setattr(dictionary_module, 'read_files', read_files)
+
+    assert Dictionary.from_files(path, cache=True).lookup('created')
+    # Neither the cache, nor half-written temporary file are left
+    assert cache_files(path) == []
+
+
+@pytest.mark.parametrize('name, value', [('CACHE_VERSION', -1), ('__version__', '0.0.0')])
+def test_invalidated_by_version(path, reads, monkeypatch, name, value):
+    Dictionary.from_files(path, cache=True)
+
+    # Cache written by other version of the code (which might have other data classes) isn't used
+    monkeypatch.setattr(dictionary_module, name, value)
+    assert Dictionary.from_files(path, cache=True).lookup('created')
+    assert len(reads) == 2
+
+
+@pytest.mark.parametrize('content', [b'', b'garbage', b'\x80\x04K\x01.', None])
+def test_broken_cache(path, reads, content):
+    Dictionary.from_files(path, cache=True)
+
+    if content is None:
+        # Valid key, but the data is not what is expected (unpacking fails with TypeError)
+        with open(path + '.spylls-cache', 'rb') as file:
+            key = pickle.load(file)
+        content = pickle.dumps(key) + pickle.dumps(None)
+    with open(path + '.spylls-cache', 'wb') as file:
+        file.write(content)
+
+    assert Dictionary.from_files(path, cache=True).lookup('created')
+    assert len(reads) == 2
+    # ...and the cache is rewritten
+    assert Dictionary.from_files(path, cache=True).lookup('created')
+    assert len(reads) == 2
@@ -0,0 +1,39 @@
+import pickle
+
+import pytest
+
+from spylls.hunspell import Dictionary
+from spylls.hunspell.data import dic
+
+
+def test_no_data_is_shared_and_read_only():
+    dictionary = Dictionary.from_files('tests/integrational/fixtures/base')
+    words = [word for word in dictionary.dic.words if not word.data]
+
+    assert words
+    assert all(word.data is dic.NO_DATA for word in words)
+
+    with pytest.raises(TypeError):
+        dic.NO_DATA['ph'] = ['foo']
+    assert not hasattr(dic.NO_DATA, 'setdefault')
+
+    assert dict(dic.NO_DATA) == {}
+    assert pickle.loads(pickle.dumps(dic.NO_DATA)) is dic.NO_DATA
+
+
+def test_lowercase_index():
+    # Only words with capitals are indexed by lowercase form; words without them are in the main
+    # index already, and add nothing (not even single chars of the word) to the lowercase one
+    dictionary = Dictionary.from_files('tests/integrational/fixtures/dotless_i')
+
+    assert dict(dictionary.dic.lowercase_index) == {
+        'diyarbakır': dictionary.dic.homonyms('Diyarbakır')
+    }
+    assert not dictionary.dic.homonyms('iç', ignorecase=True)
+
+    # ...which previously made capitalized single letters "valid" by bogus "ı" stem
+    assert not dictionary.lookup('I')
+    assert not dictionary.lookup('İ')
+    assert not dictionary.lookup('Ç')
+    assert dictionary.lookup('İç')
+    assert dictionary.lookup('DİYARBAKIR')
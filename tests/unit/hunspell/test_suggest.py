@@ -0,0 +1,18 @@
+from spylls.hunspell import Dictionary
+
+
+def test_forceucase():
+    # Capitalized compounds are found by FORCEUCASE, and contain characters that no stem or affix
+    # does: they still should be suggested.
+    dictionary = Dictionary.from_files('tests/integrational/fixtures/forceucase')
+
+    def suggest(word):
+        return list(dictionary.suggest(word))
+
+    assert suggest('Foobazz') == ['Foobaz']
+    assert suggest('Foobaz') == ['Foobaz', 'Foo baz']
+    assert suggest('Foobarbaz') == ['Foobarbaz', 'Foobazbar']
+    assert suggest('Foobarbazz') == ['Foobarbaz']
+    assert suggest('Foobbaz') == ['Foobaz']
+    assert suggest('oobar') == ['Foobar']
+    assert suggest('Foo-barbaz') == ['Foobarbaz']